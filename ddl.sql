@@ -52,4 +52,7 @@ ALTER TABLE store.store_orders_fact PARTITION BY date_ordered::DATE GROUP BY DAT
 SELECT PARTITION_TABLE('store.store_orders_fact');
 CREATE PROJECTION ytd_orders AS SELECT * FROM store.store_orders_fact ORDER BY date_ordered
     ON PARTITION RANGE BETWEEN date_trunc('year',now())::date AND NULL;
-SELECT start_refresh();
\ No newline at end of file
+SELECT start_refresh();
+
+-- Create a unique constraint
+ALTER TABLE public.vendor_dimension ADD CONSTRAINT uq_vendor_dimension_name UNIQUE (vendor_name, vendor_address);
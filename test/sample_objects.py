@@ -128,6 +128,7 @@ sample_columns = [
     "average_competitor_price",
     "discontinued_flag"
     ]
+sample_columns_set = frozenset(sample_columns)
 
 sample_view_columns = [
     'SUM',
@@ -145,23 +146,23 @@ sample_projection_columns = [
     "inventory_date"
 ]
 
-sample_constraints = {
-    "fk_store_orders_vendor":"vendor_key",
-    "fk_store_orders_product":"product_key",
-    "C_NOTNULL":"store_key" ,
-    "C_NOTNULL":"product_version",
-    "fk_store_orders_employee":"employee_key",
-    "C_NOTNULL":"order_number",
-    "C_NOTNULL":"vendor_key",
-    "fk_store_orders_product":"product_version",
-    "fk_store_orders_store":"store_key",
-    "C_NOTNULL":"employee_key",
-    "C_NOTNULL":"product_key"
+sample_unique_constraints = {
+    "uq_vendor_dimension_name": {"vendor_name", "vendor_address"},
 }
 
 sample_pk = ['customer_key']
 
+# Foreign keys of store.store_orders_fact:
+# name -> (referred table, constrained columns, referred columns)
+sample_foreign_keys = {
+    "fk_store_orders_store": ("store_dimension", ["store_key"], ["store_key"]),
+    "fk_store_orders_product": ("product_dimension", ["product_key", "product_version"], ["product_key", "product_version"]),
+    "fk_store_orders_vendor": ("vendor_dimension", ["vendor_key"], ["vendor_key"]),
+    "fk_store_orders_employee": ("employee_dimension", ["employee_key"], ["employee_key"]),
+}
+
 sample_model_list = ["naive_house84_model"]
+sample_model_set = frozenset(sample_model_list)
 
 sample_tags = {'customer_dimension': 'dbadmin', 'product_dimension': 'dbadmin', 'promotion_dimension': 'dbadmin', 'date_dimension': 'dbadmin', 'vendor_dimension': 'dbadmin', 'employee_dimension': 'dbadmin', 'shipping_dimension': 'dbadmin', 'warehouse_dimension': 'dbadmin', 'inventory_fact': 'dbadmin', 'vmart_load_success': 'dbadmin'}
 
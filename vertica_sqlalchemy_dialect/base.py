@@ -27,7 +27,11 @@ from sqlalchemy import sql
 from sqlalchemy import util
 from textwrap import dedent
 from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import lru_cache
+from itertools import compress
+from operator import itemgetter
 import re
 import traceback
 
@@ -61,6 +65,17 @@ from functools import lru_cache
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Patterns used by VerticaDialect._get_column_info, once per reflected column.
+_RE_STRIP_PARENS = re.compile(r"\(.*\)")
+_RE_CHARLEN = re.compile(r"\(([\d,]+)\)")
+_RE_ARGS = re.compile(r"\((.*)\)")
+_RE_SPLIT_COMMA = re.compile(r"\s*,\s*")
+_RE_INTERVAL = re.compile(r"interval (.+)", re.I)
+_RE_NEXTVAL = re.compile(r"""(nextval\(')([^']+)('.*$)""")
+
+
+_VERTICA_VERSION_RE = re.compile(r"Vertica Analytic Database v(\d+)\.(\d+)\.(\d+)")
+
 ischema_names = {
     "INT": INTEGER,
     "INTEGER": INTEGER,
@@ -107,6 +122,72 @@ ischema_names = {
 }
 
 
+@util.decorator
+def _global_cache(fn, self, connection, table_name, schema=None, **kw):
+    """Memoize a per-table reflection method in the dialect's
+    ``_global_reflection_cache`` while :meth:`VerticaDialect.caching_schema`
+    is active.
+    """
+    cache = self._global_reflection_cache
+    if cache is None:
+        return fn(self, connection, table_name, schema, **kw)
+    # The cache is process-wide, so keep databases apart by engine URL.
+    key = (fn.__name__, str(connection.engine.url), schema, table_name)
+    if key not in cache:
+        cache[key] = fn(self, connection, table_name, schema, **kw)
+    return cache[key]
+
+
+@util.decorator
+def _global_schema_cache(fn, self, connection, schema=None, **kw):
+    """Memoize a schema-wide reflection helper in the dialect's
+    ``_global_reflection_cache`` when no ``info_cache`` is given, so the
+    per-table methods running under :meth:`VerticaDialect.caching_schema`
+    share one catalog scan per schema.
+    """
+    cache = self._global_reflection_cache
+    if cache is None or kw.get("info_cache") is not None:
+        return fn(self, connection, schema, **kw)
+    key = (fn.__name__, str(connection.engine.url), schema)
+    if key not in cache:
+        cache[key] = fn(self, connection, schema, **kw)
+    return cache[key]
+
+
+@lru_cache(maxsize=128)
+def _compiled(stmt_text):
+    """Return the text() construct for ``stmt_text``, dedented and parsed
+    only the first time a given SQL string is seen.
+    """
+    return sql.text(dedent(stmt_text))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name):
+    # Kept at module level so the cache does not hold on to dialect instances.
+    return name.rstrip().lower()
+
+
+def _quote_literal(value):
+    """Quote ``value`` as a SQL string literal."""
+    return "'%s'" % str(value).replace("'", "''")
+
+
+@dataclass(frozen=True)
+class ProjectionMetadata:
+    """Properties of a single projection, see ``_get_projection_metadata``."""
+
+    is_segmented: bool
+    segmentation_key: str
+    projection_type: List[str]
+    partition_key: Optional[str]
+    num_partitions: int
+    # Size in KB, None when the projection has no storage yet.
+    size: Optional[int]
+    cached: bool
+    ros_count: Optional[int]
+
+
 class UUID(String):
     """The SQL UUID type."""
 
@@ -152,6 +233,16 @@ def TIME_WITH_TIMEZONE(*args, **kwargs):
     return TIME(*args, **kwargs)
 
 
+ischema_names.update(
+    {
+        "UUID": UUID,
+        "TIMESTAMP": TIMESTAMP_WITH_PRECISION,
+        "TIMESTAMPTZ": TIMESTAMP_WITH_TIMEZONE,
+        "TIMETZ": TIME_WITH_TIMEZONE,
+    }
+)
+
+
 class VerticaDDLCompiler(PGDDLCompiler):
     def get_column_specification(self, column, **kwargs):
         colspec = self.preparer.format_column(column)
@@ -202,7 +293,9 @@ class VerticaInspector(reflection.Inspector):
         :param: table: Name of the table
 
         """
-        return self.dialect._get_extra_tags(self.bind, table, schema)
+        return self.dialect._get_extra_tags(
+            self.bind, table, schema, info_cache=self.info_cache
+        )
 
     def get_projection_comment(self, projection,schema=None, **kw):
         """Return information about the table properties for ``table_name``.
@@ -346,329 +439,769 @@ class VerticaInspector(reflection.Inspector):
         return self.dialect._populate_projection_lineage(self.bind, projection,schema, **kw)
 
 
+# Reflection statements that only differ by their bound values are built once
+# at import time, so every call reuses the same text() construct and with it
+# SQLAlchemy's compiled cache entry.
+_HAS_SCHEMA_STMT = sql.text(
+    dedent(
+        """
+        SELECT EXISTS (
+            SELECT schema_name
+            FROM v_catalog.schemata
+            WHERE lower(schema_name) = :schema)
+        """
+    )
+)
+
+# Names are lower-cased so existence checks are plain set lookups.
+_SCHEMA_RELATION_NAMES_STMT = sql.text(
+    dedent(
+        """
+        SELECT lower(table_name)
+        FROM v_catalog.tables
+        WHERE lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        UNION ALL
+        SELECT lower(table_name)
+        FROM v_catalog.views
+        WHERE lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        """
+    )
+)
+
+_SCHEMA_SEQUENCE_NAMES_STMT = sql.text(
+    dedent(
+        """
+        SELECT lower(sequence_name)
+        FROM v_catalog.sequences
+        WHERE lower(sequence_schema) = COALESCE(:schema, lower(current_schema()))
+        """
+    )
+)
+
+_EXISTING_RELATION_NAMES_STMT = sql.text(
+    dedent(
+        """
+        SELECT lower(table_name)
+        FROM v_catalog.tables
+        WHERE lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        AND lower(table_name) IN :table_names
+        UNION ALL
+        SELECT lower(table_name)
+        FROM v_catalog.views
+        WHERE lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        AND lower(table_name) IN :table_names
+        """
+    )
+).bindparams(sql.bindparam("table_names", expanding=True))
+
+_HAS_SEQUENCE_STMT = sql.text(
+    dedent(
+        """
+        SELECT EXISTS (
+            SELECT sequence_name
+            FROM v_catalog.sequences
+            WHERE lower(sequence_schema) = COALESCE(:schema, lower(current_schema()))
+            AND lower(sequence_name) = :sequence
+        )
+        """
+    )
+)
+
+_HAS_TYPE_STMT = sql.text(
+    dedent(
+        """
+        SELECT 1
+        FROM v_catalog.types
+        WHERE lower(type_name) = :type
+        LIMIT 1
+        """
+    )
+)
+
+_TABLE_OID_STMT = sql.text(
+    dedent(
+        """
+        SELECT table_id FROM v_catalog.tables
+        WHERE lower(table_name) = :table
+        AND lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        UNION
+        SELECT table_id FROM v_catalog.views
+        WHERE lower(table_name) = :table
+        AND lower(table_schema) = COALESCE(:schema, lower(current_schema()))
+        """
+    )
+)
+
+
+# One row: every list is aggregated server side, and the communal locations
+# only exist on Eon databases.
+_DATABASE_PROPERTIES_STMT = sql.text(
+    dedent(
+        """
+        WITH cluster_type AS (
+            SELECT CASE COUNT(*) WHEN 0 THEN 'Enterprise' ELSE 'Eon' END AS database_mode
+            FROM v_catalog.shards
+        ), communal AS (
+            SELECT LISTAGG(location_path USING PARAMETERS separator=' | ', max_length=65000) AS communal_path
+            FROM storage_locations
+            WHERE sharing_type = 'COMMUNAL'
+        ), subclusters AS (
+            SELECT LISTAGG(subcluster_name || ' -- ' || subclustersize || ' GB' USING PARAMETERS separator=' | ', max_length=65000) AS subclusters
+            FROM (
+                SELECT subclusters.subcluster_name, CAST(SUM(disk_space_used_mb // 1024) AS VARCHAR(10)) AS subclustersize
+                FROM subclusters
+                INNER JOIN disk_storage USING (node_name)
+                GROUP BY subclusters.subcluster_name
+            ) s
+        ), cluster_size AS (
+            SELECT ROUND(SUM(disk_space_used_mb) // 1024) AS cluster_size
+            FROM disk_storage
+        )
+        SELECT database_mode, communal_path, subclusters, cluster_size
+        FROM cluster_type, communal, subclusters, cluster_size
+        """
+    )
+)
+
+_SCHEMA_PROPERTIES_STMT = sql.text(
+    dedent(
+        """
+        WITH projection_count AS (
+            SELECT COUNT(projection_name) AS pc
+            FROM v_catalog.projections
+            WHERE lower(projection_schema) = :schema
+        ), udx AS (
+            SELECT LISTAGG(function_name USING PARAMETERS separator=', ', max_length=65000) AS udx_list
+            FROM USER_FUNCTIONS
+            WHERE lower(schema_name) = :schema
+        ), udl AS (
+            SELECT LISTAGG(lib_name || ' -- ' || description USING PARAMETERS separator=' | ', max_length=65000) AS udx_language
+            FROM USER_LIBRARIES
+            WHERE lower(schema_name) = :schema
+        )
+        SELECT pc, udx_list, udx_language
+        FROM projection_count, udx, udl
+        """
+    )
+)
+
+# projection_storage already carries the anchor table, so there is no need to
+# join projections against the per-container rows.
+_TABLE_PROPERTIES_STMT = sql.text(
+    dedent(
+        """
+        SELECT r.table_name, r.create_time, COALESCE(s.used_kb, 0)::INT AS table_size
+        FROM (
+            SELECT table_name, create_time
+            FROM v_catalog.tables
+            WHERE lower(table_schema) = :schema
+            UNION ALL
+            SELECT table_name, create_time
+            FROM v_catalog.views
+            WHERE lower(table_schema) = :schema
+        ) r
+        LEFT JOIN (
+            SELECT anchor_table_name, SUM(used_bytes) // 1024 AS used_kb
+            FROM v_monitor.projection_storage
+            WHERE lower(anchor_table_schema) = :schema
+            GROUP BY anchor_table_name
+        ) s ON s.anchor_table_name = r.table_name
+        """
+    )
+)
+
+_SCHEMA_COLUMNS_STMT = sql.text(
+    dedent(
+        """
+        SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
+        FROM v_catalog.columns
+        where lower(table_schema) = :schema
+        UNION ALL
+        SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
+        FROM v_catalog.view_columns
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_TABLE_COLUMNS_STMT = sql.text(
+    dedent(
+        """
+        SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
+        FROM v_catalog.columns
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_MULTI_COLUMNS_STMT = sql.text(
+    dedent(
+        """
+        SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
+        FROM v_catalog.columns
+        WHERE lower(table_schema) = :schema
+        AND lower(table_name) IN :table_names
+        UNION ALL
+        SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
+        FROM v_catalog.view_columns
+        WHERE lower(table_schema) = :schema
+        AND lower(table_name) IN :table_names
+        """
+    )
+).bindparams(sql.bindparam("table_names", expanding=True))
+
+_MULTI_PK_STMT = sql.text(
+    dedent(
+        """
+        SELECT constraint_name, constraint_type, lower(table_name) as table_name,
+            column_name
+        FROM v_catalog.primary_keys
+        WHERE lower(table_schema) = :schema
+        AND lower(table_name) IN :table_names
+        ORDER BY table_name, ordinal_position
+        """
+    )
+).bindparams(sql.bindparam("table_names", expanding=True))
+
+_SCHEMA_CONSTRAINTS_STMT = sql.text(
+    dedent(
+        """
+        SELECT cc.constraint_name, cc.constraint_type,
+            lower(cc.table_name) as table_name, cc.column_name,
+            cc.reference_table_schema, cc.reference_table_name,
+            cc.reference_column_name
+        FROM v_catalog.constraint_columns cc
+        LEFT JOIN v_catalog.primary_keys pk
+        ON pk.constraint_id = cc.constraint_id
+        AND pk.column_name = cc.column_name
+        LEFT JOIN v_catalog.foreign_keys fk
+        ON fk.constraint_id = cc.constraint_id
+        AND fk.column_name = cc.column_name
+        WHERE lower(cc.table_schema) = COALESCE(:schema, lower(current_schema()))
+        ORDER BY cc.table_name, cc.constraint_name,
+            COALESCE(pk.ordinal_position, fk.ordinal_position)
+        """
+    )
+)
+
+_TABLE_CONSTRAINTS_STMT = sql.text(
+    dedent(
+        """
+        SELECT cc.constraint_name, cc.constraint_type,
+            lower(cc.table_name) as table_name, cc.column_name,
+            cc.reference_table_schema, cc.reference_table_name,
+            cc.reference_column_name
+        FROM v_catalog.constraint_columns cc
+        LEFT JOIN v_catalog.primary_keys pk
+        ON pk.constraint_id = cc.constraint_id
+        AND pk.column_name = cc.column_name
+        LEFT JOIN v_catalog.foreign_keys fk
+        ON fk.constraint_id = cc.constraint_id
+        AND fk.column_name = cc.column_name
+        WHERE lower(cc.table_schema) = COALESCE(:schema, lower(current_schema()))
+        AND lower(cc.table_name) = :table
+        ORDER BY cc.constraint_name,
+            COALESCE(pk.ordinal_position, fk.ordinal_position)
+        """
+    )
+)
+
+_CHECK_CONSTRAINTS_STMT = sql.text(
+    dedent(
+        """
+        SELECT constraint_name, column_name
+        FROM v_catalog.constraint_columns
+        WHERE table_id = :oid
+        AND constraint_type = 'c'
+        """
+    )
+)
+
+_MODEL_NAMES_STMT = sql.text(
+    dedent(
+        """
+        SELECT model_name
+        FROM models
+        WHERE lower(schema_name) = :schema
+        ORDER BY model_name
+        """
+    )
+)
+
+_OAUTH_NAMES_STMT = sql.text(
+    dedent(
+        """
+        SELECT auth_name from v_catalog.client_auth
+        WHERE auth_method = 'OAUTH'
+        """
+    )
+)
+
+# Flag columns of _PROJECTION_METADATA_STMT, reported as the projection
+# type when set.
+_PROJECTION_TYPE_COLUMNS = (
+    "is_super_projection",
+    "is_key_constraint_projection",
+    "is_aggregate_projection",
+    "has_expressions",
+)
+
+_PROJECTION_METADATA_STMT = sql.text(
+    dedent(
+        """
+        SELECT p.is_segmented, p.segment_expression,
+            p.is_super_projection, p.is_key_constraint_projection,
+            p.is_aggregate_projection, p.has_expressions,
+            s.ros_count, s.used_bytes // 1024 AS used_kb,
+            (SELECT MIN(partition_key)
+                FROM v_monitor.partitions
+                WHERE lower(projection_name) = :projection
+                AND lower(table_schema) = :schema) AS partition_key,
+            (SELECT COUNT(ros_id)
+                FROM v_monitor.partitions
+                WHERE lower(projection_name) = :projection
+                AND lower(table_schema) = :schema) AS num_partitions,
+            (SELECT COUNT(*)
+                FROM DEPOT_PIN_POLICIES
+                WHERE lower(object_name) = :projection
+                AND lower(schema_name) = :schema) AS pin_policies
+        FROM v_catalog.projections p
+        LEFT JOIN (
+            SELECT projection_schema, projection_name,
+                SUM(ros_count) AS ros_count, SUM(used_bytes) AS used_bytes
+            FROM v_monitor.projection_storage
+            WHERE lower(projection_name) = :projection
+            AND lower(projection_schema) = :schema
+            GROUP BY projection_schema, projection_name
+        ) s
+        ON s.projection_schema = p.projection_schema
+        AND s.projection_name = p.projection_name
+        WHERE lower(p.projection_name) = :projection
+        AND lower(p.projection_schema) = :schema
+        LIMIT 1
+        """
+    )
+)
+
+_SCHEMA_PROJECTION_METADATA_STMT = sql.text(
+    dedent(
+        """
+        SELECT lower(p.projection_name) AS projection_name,
+            p.is_segmented, p.segment_expression,
+            p.is_super_projection, p.is_key_constraint_projection,
+            p.is_aggregate_projection, p.has_expressions,
+            s.ros_count, s.used_bytes // 1024 AS used_kb,
+            pt.partition_key,
+            COALESCE(pt.num_partitions, 0) AS num_partitions,
+            COALESCE(d.pin_policies, 0) AS pin_policies
+        FROM v_catalog.projections p
+        LEFT JOIN (
+            SELECT lower(projection_name) AS projection_name,
+                SUM(ros_count) AS ros_count, SUM(used_bytes) AS used_bytes
+            FROM v_monitor.projection_storage
+            WHERE lower(projection_schema) = :schema
+            GROUP BY lower(projection_name)
+        ) s
+        ON s.projection_name = lower(p.projection_name)
+        LEFT JOIN (
+            SELECT lower(projection_name) AS projection_name,
+                MIN(partition_key) AS partition_key,
+                COUNT(ros_id) AS num_partitions
+            FROM v_monitor.partitions
+            WHERE lower(table_schema) = :schema
+            GROUP BY lower(projection_name)
+        ) pt
+        ON pt.projection_name = lower(p.projection_name)
+        LEFT JOIN (
+            SELECT lower(object_name) AS object_name, COUNT(*) AS pin_policies
+            FROM DEPOT_PIN_POLICIES
+            WHERE lower(schema_name) = :schema
+            GROUP BY lower(object_name)
+        ) d
+        ON d.object_name = lower(p.projection_name)
+        WHERE lower(p.projection_schema) = :schema
+        """
+    )
+)
+
+_OAUTH_COMMENT_STMT = sql.text(
+    dedent(
+        """
+        SELECT auth_oid,
+        is_auth_enabled,
+        is_fallthrough_enabled,
+        auth_priority,
+        address_priority,
+        REGEXP_SUBSTR(auth_parameters, 'client_id=([^,]*)', 1, 1, '', 1)
+            AS client_id,
+        REGEXP_SUBSTR(auth_parameters, 'client_secret=([^,]*)', 1, 1, '', 1)
+            AS client_secret,
+        REGEXP_SUBSTR(auth_parameters, 'discovery_?url=([^,]*)', 1, 1, 'i', 1)
+            AS discovery_url,
+        REGEXP_SUBSTR(auth_parameters, 'introspect_?url=([^,]*)', 1, 1, 'i', 1)
+            AS introspect_url
+        FROM v_catalog.client_auth
+        WHERE auth_method = 'OAUTH'
+        LIMIT 1
+        """
+    )
+)
+
+_TABLE_OWNERS_STMT = sql.text(
+    dedent(
+        """
+        SELECT table_name ,owner_name
+        FROM v_catalog.tables
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_VIEW_COLUMNS_STMT = sql.text(
+    dedent(
+        """
+        SELECT column_name, data_type, '' as column_default, true as is_nullable,lower(table_name) as table_name
+        FROM v_catalog.view_columns
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_VIEW_COMMENTS_STMT = sql.text(
+    dedent(
+        """
+        SELECT create_time , table_name
+        FROM v_catalog.views
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_VIEW_OWNERS_STMT = sql.text(
+    dedent(
+        """
+        SELECT table_name ,owner_name
+        FROM v_catalog.views
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_VIEW_LINEAGE_STMT = sql.text(
+    dedent(
+        """
+        select table_name ,table_schema, reference_table_name ,reference_table_schema  from v_catalog.view_tables where table_schema = :schema
+        """
+    )
+)
+
+_PROJECTION_COLUMNS_STMT = sql.text(
+    dedent(
+        """
+        SELECT projection_column_name as column_name, data_type, '' as column_default, true as is_nullable,lower(projection_name) as table_name
+        FROM PROJECTION_COLUMNS
+        where lower(table_schema) = :schema
+        """
+    )
+)
+
+_PROJECTION_OWNERS_STMT = sql.text(
+    dedent(
+        """
+        SELECT projection_name as table_name, owner_name
+        FROM v_catalog.projections
+        WHERE lower(projection_schema) = :schema
+        """
+    )
+)
+
+_PROJECTION_LINEAGE_STMT = sql.text(
+    dedent(
+        """
+        select basename , schemaname , name from vs_projections where schemaname = :schema
+        """
+    )
+)
+
+_VIEW_DEFINITIONS_STMT = sql.text(
+    dedent(
+        """
+        SELECT VIEW_DEFINITION , table_name
+        FROM V_CATALOG.VIEWS
+        WHERE table_schema=:schema
+        """
+    )
+)
+
+
 # noinspection PyArgumentList,PyAbstractClass
 
 
 class VerticaDialect(default.DefaultDialect):
     name = "vertica"
     ischema_names = ischema_names
+    supports_statement_cache = True
     ddl_compiler = VerticaDDLCompiler
     inspector = VerticaInspector
 
+    # Whether the driver runs ';'-separated statements in one execute and
+    # exposes each result set through cursor.nextset().
+    supports_multi_statement_results = False
+
+    # Catalog snapshot shared by every connection and inspector while
+    # caching_schema() is active, None otherwise.
+    _global_reflection_cache: Optional[Dict[Any, Any]] = None
+
     def __init__(self, json_serializer=None, json_deserializer=None, **kwargs):
         default.DefaultDialect.__init__(self, **kwargs)
 
         self._json_deserializer = json_deserializer
         self._json_serializer = json_serializer
+        # Server version of this dialect's engine, asked once.
+        self._server_version: Optional[Tuple[int, ...]] = None
 
     def initialize(self, connection):
         super().initialize(connection)
+        # DefaultDialect.initialize() has just asked for current_schema();
+        # hand it to the first connection instead of asking again.
+        if self.default_schema_name is not None:
+            connection.info.setdefault(
+                "vertica_default_schema", self.default_schema_name
+            )
+
+    @classmethod
+    @contextmanager
+    def caching_schema(cls):
+        """Cache reflection results for the duration of the block.
+
+        Unlike ``info_cache``, which lives as long as a single inspector, the
+        cache is shared by every connection of this dialect. It keeps both
+        the per-table results of ``get_columns``/``get_pk_constraint``/
+        ``get_unique_constraints`` and the schema-wide relation, column and
+        constraint listings they are built from, so each listing is read
+        from ``v_catalog`` once per schema. Use it only while the catalog is
+        not being changed.
+        """
+        # Always set on the base class: assigning through a driver subclass
+        # would leave a subclass attribute shadowing later blocks.
+        previous = VerticaDialect._global_reflection_cache
+        VerticaDialect._global_reflection_cache = {}
+        try:
+            yield VerticaDialect._global_reflection_cache
+        finally:
+            VerticaDialect._global_reflection_cache = previous
+
+    def reset_reflection(self):
+        """Forget the schema-wide reflection results memoized on the dialect.
+
+        The lru-cached ``fetch_*`` helpers are kept for the lifetime of the
+        process; call this after DDL so the next reflection call reads
+        ``v_catalog`` again.
+        """
+        for attr in vars(VerticaDialect).values():
+            cache_clear = getattr(attr, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+        if self._global_reflection_cache is not None:
+            self._global_reflection_cache.clear()
+
+    def _reflection_cache_enabled(self, kw):
+        # Schema-wide bulk queries only pay off when their result is kept
+        # for the following per-table calls; otherwise query just the
+        # requested objects.
+        return (
+            kw.get("info_cache") is not None
+            or self._global_reflection_cache is not None
+        )
 
     def _get_default_schema_name(self, connection):
         return connection.scalar("SELECT current_schema()")
 
+    def _cached_default_schema(self, connection):
+        # connection.info lives as long as the DBAPI connection, so the
+        # current schema is asked for once per pooled connection rather than
+        # once per reflection call.
+        info = connection.info
+        if "vertica_default_schema" not in info:
+            info["vertica_default_schema"] = self._get_default_schema_name(
+                connection
+            )
+        return info["vertica_default_schema"]
+
     def _get_server_version_info(self, connection):
+        if self._server_version is None:
+            self._server_version = self._query_server_version_info(connection)
+        return self._server_version
+
+    def _query_server_version_info(self, connection):
         v = connection.scalar("SELECT version()")
-        m = re.match(r".*Vertica Analytic Database v(\d+)\.(\d+)\.(\d)+.*", v)
+        m = _VERTICA_VERSION_RE.search(v)
         if not m:
             raise AssertionError(
                 "Could not determine version from string '%(ver)s'" % {"ver": v}
             )
-        return tuple([int(x) for x in m.group(1, 2, 3) if x is not None])
+        return (int(m[1]), int(m[2]), int(m[3]))
 
     # noinspection PyRedeclaration
-    def _get_default_schema_name(self, connection):
-        return connection.scalar("SELECT current_schema()")
-
     def create_connect_args(self, url):
         opts = url.translate_connect_args(username="user")
         opts.update(url.query)
         return [], opts
 
     def has_schema(self, connection, schema):
-        has_schema_sql = sql.text(
-            dedent(
-                """
-            SELECT EXISTS (
-            SELECT schema_name
-            FROM v_catalog.schemata
-            WHERE lower(schema_name) = '%(schema)s')
-        """
-                % {"schema": schema.lower()}
-            )
-        )
-
-        c = connection.execute(has_schema_sql)
+        c = connection.execute(_HAS_SCHEMA_STMT, {"schema": schema.lower()})
         return bool(c.scalar())
 
-    def has_table(self, connection, table_name, schema=None):
-        if schema is None:
-            schema = self._get_default_schema_name(connection)
-
-        has_table_sql = sql.text(
-            dedent(
-                """
-            SELECT EXISTS (
-            SELECT table_name
-            FROM v_catalog.all_tables
-            WHERE lower(table_name) = '%(table)s'
-            AND lower(schema_name) = '%(schema)s')
-        """
-                % {"schema": schema.lower(), "table": table_name.lower()}
+    def has_table(self, connection, table_name, schema=None, **kw):
+        return bool(self._has_tables(connection, schema, [table_name], **kw))
+
+    def _has_tables(self, connection, schema, table_names, **kw):
+        """Return the subset of ``table_names`` that exist as a table or view
+        in ``schema``, matched case-insensitively.
+        """
+        if schema is not None:
+            schema = schema.lower()
+
+        if self._reflection_cache_enabled(kw):
+            existing = self._existing_names(connection, "relation", schema, **kw)
+        elif table_names:
+            existing = set(
+                connection.execute(
+                    _EXISTING_RELATION_NAMES_STMT,
+                    {
+                        "schema": schema,
+                        "table_names": [name.lower() for name in table_names],
+                    },
+                ).scalars()
             )
-        )
+        else:
+            existing = set()
+        return {name for name in table_names if name.lower() in existing}
 
-        c = connection.execute(has_table_sql)
-        return bool(c.scalar())
+    def has_sequence(self, connection, sequence_name, schema=None, **kw):
+        if schema is not None:
+            schema = schema.lower()
 
-    def has_sequence(self, connection, sequence_name, schema=None):
-        if schema is None:
-            schema = self._get_default_schema_name(connection)
+        if self._reflection_cache_enabled(kw):
+            existing = self._existing_names(connection, "sequence", schema, **kw)
+            return sequence_name.lower() in existing
 
-        has_seq_sql = sql.text(
-            dedent(
-                """
-            SELECT EXISTS (
-            SELECT sequence_name
-            FROM v_catalog.sequences
-            WHERE lower(sequence_name) = '%(sequence)s'
-            AND lower(sequence_schema) = '%(schema)s')
-        """
-                % {"schema": schema.lower(), "sequence": sequence_name.lower()}
-            )
+        c = connection.execute(
+            _HAS_SEQUENCE_STMT,
+            {"schema": schema, "sequence": sequence_name.lower()},
         )
-
-        c = connection.execute(has_seq_sql)
         return bool(c.scalar())
 
-    def has_type(self, connection, type_name):
-        has_type_sql = sql.text(
-            dedent(
-                """
-            SELECT EXISTS (
-            SELECT type_name
-            FROM v_catalog.types
-            WHERE lower(type_name) = '%(type)s')
-        """
-                % {"type": type_name.lower()}
-            )
-        )
+    def _existing_names(self, connection, kind, schema, **kw):
+        # One query lists every relation (or sequence) of the schema. The
+        # set only lives as long as the reflection scope (the info_cache or
+        # caching_schema()), so objects created by other sessions show up
+        # in the next one. A None schema is resolved to current_schema() by
+        # the statement itself.
+        cache = kw.get("info_cache")
+        key = ("_existing_names", kind, schema)
+        if cache is None:
+            cache = self._global_reflection_cache
+            key += (str(connection.engine.url),)
+        if key not in cache:
+            names_sql = (
+                _SCHEMA_RELATION_NAMES_STMT
+                if kind == "relation"
+                else _SCHEMA_SEQUENCE_NAMES_STMT
+            )
+            cache[key] = frozenset(
+                connection.execute(names_sql, {"schema": schema}).scalars()
+            )
+        return cache[key]
 
-        c = connection.execute(has_type_sql)
-        return bool(c.scalar())
+    def has_type(self, connection, type_name):
+        c = connection.execute(_HAS_TYPE_STMT, {"type": type_name.lower()})
+        return c.first() is not None
 
     def _get_database_properties(self, connection, database):
         try:
-            cluster_type_qry = sql.text(
-                dedent(
-                    """SELECT CASE COUNT(*) WHEN 0 THEN 'Enterprise' ELSE 'Eon' END AS database_mode FROM v_catalog.shards """
-                )
-            )
-
-            communal_storage_path = sql.text(
-                dedent(
-                    """SELECT location_path from storage_locations WHERE sharing_type = 'COMMUNAL' """
-                )
-            )
-            cluster_type = ""
-            communal_path = ""
-            cluster_type_res = connection.execute(cluster_type_qry)
-            for each in cluster_type_res:
-                cluster_type = each.database_mode
-                if cluster_type.lower() == "eon":
-                    for each in connection.execute(communal_storage_path):
-                        communal_path += str(each.location_path) + " | "
-            SUBCLUSTER_SIZE = sql.text(
-                dedent(
-                    """
-                        SELECT subclusters.subcluster_name , CAST(sum(disk_space_used_mb // 1024) as varchar(10)) as subclustersize from subclusters  
-                        inner join disk_storage using (node_name) 
-                        group by subclusters.subcluster_name
-                            """
-                )
-            )
-            subclusters = " "
-            for data in connection.execute(SUBCLUSTER_SIZE):
-                subclusters += (
-                    f"{data['subcluster_name']} -- {data['subclustersize']} GB |  "
-                )
-            cluster__size = sql.text(
-                dedent(
-                    """
-                select ROUND(SUM(disk_space_used_mb) //1024 ) as cluster_size
-                from disk_storage
-            """
-                )
-            )
-            cluster_size = ""
-            for each in connection.execute(cluster__size):
-                cluster_size = str(each.cluster_size) + " GB"
-
+            row = connection.execute(_DATABASE_PROPERTIES_STMT).mappings().first()
             return {
-                "cluster_type": cluster_type,
-                "cluster_size": cluster_size,
-                "subcluster": subclusters,
-                "communal_storage_path": communal_path,
+                "cluster_type": row["database_mode"],
+                "cluster_size": str(row["cluster_size"]) + " GB",
+                "subcluster": row["subclusters"] or "",
+                "communal_storage_path": row["communal_path"] or "",
             }
         except Exception as ex:
             logging.warning(f"{database}", f"unable to get extra_properties : {ex}")
 
     def _get_schema_properties(self, connection, schema):
         try:
-            # Projection count
-            projection_count_query = sql.text(
-                dedent(
-                    """
-                SELECT 
-                    COUNT(projection_name)  as pc
-                from 
-                    v_catalog.projections 
-                WHERE lower(projection_schema) = '%(schema)s'
-            """
-                    % {"schema": schema.lower()}
-                )
-            )
-
-            projection_count = None
-            for each in connection.execute(projection_count_query):
-                projection_count = each.pc
-
-            UDL_LANGUAGE = sql.text(
-                dedent(
-                    """
-                SELECT lib_name , description 
-                    FROM USER_LIBRARIES
-                WHERE lower(schema_name) = '%(schema)s'
-            """
-                    % {"schema": schema.lower()}
-                )
-            )
-
-            # UDX list
-            UDX_functions_qry = sql.text(
-                dedent(
-                    """
-                SELECT 
-                    function_name 
-                FROM 
-                    USER_FUNCTIONS
-                Where schema_name  = '%(schema)s'
-            """
-                    % {
-                        "schema": schema.lower(),
-                    }
-                )
+            row = (
+                connection.execute(_SCHEMA_PROPERTIES_STMT, {"schema": schema.lower()})
+                .mappings()
+                .first()
             )
-            udx_list = ""
-            for each in connection.execute(UDX_functions_qry):
-                udx_list += each.function_name + ", "
-
-            # UDX Language
-            user_defined_library = ""
-
-            for data in connection.execute(UDL_LANGUAGE):
-                user_defined_library += (
-                    f"{data['lib_name']} -- {data['description']} |  "
-                )
-
-            # print("projection_count: " + str(projection_count)
             return {
-                "projection_count": str(projection_count),
-                "udx_list": str(udx_list),
-                "udx_language": str(user_defined_library),
+                "projection_count": str(row["pc"]),
+                "udx_list": row["udx_list"] or "",
+                "udx_language": row["udx_language"] or "",
             }
 
-            # return {"projection_count": "projection_count"}
-
         except Exception as ex:
             self.report.report_failure(
                 f"{schema}", f"unable to get extra_properties : {ex}"
             )
 
     @reflection.cache
-    def get_schema_names(self, connection, **kw):
-        get_schemas_sql = sql.text(
-            dedent(
-                """
+    def get_schema_names(self, connection, exclude_prefix=None, **kw):
+        """Return all user schema names.
+
+        :param exclude_prefix: Optional, also leave out the schemas whose
+         name starts with this prefix.
+        """
+        if exclude_prefix is not None:
+            prefix_condition = "AND schema_name NOT LIKE :prefix ESCAPE '\\'"
+        else:
+            prefix_condition = ""
+
+        get_schemas_sql = _compiled(
+            """
             SELECT schema_name
             FROM v_catalog.schemata
+            WHERE schema_name NOT LIKE 'v\\_%%' ESCAPE '\\'
+            %(prefix_condition)s
         """
-            )
+            % {"prefix_condition": prefix_condition}
         )
+        if exclude_prefix is not None:
+            prefix = re.sub(r"([\\%_])", r"\\\1", exclude_prefix)
+            get_schemas_sql = get_schemas_sql.bindparams(prefix=prefix + "%")
 
         c = connection.execute(get_schemas_sql)
-        return [row[0] for row in c if not row[0].startswith("v_")]
+        return c.scalars().all()
     
     
-    @lru_cache(maxsize=None)
-    def fetch_table_properties(self,connection, schema):
-        
-
-        sct = sql.text(
-            dedent(
-                """
-                SELECT create_time , table_name
-                FROM v_catalog.tables
-                where lower(table_schema) = '%(schema)s'
-                UNION ALL
-                SELECT create_time , table_name
-                FROM v_catalog.views
-                where lower(table_schema) = '%(schema)s'
-                """
-                % {"schema": schema.lower()}
-            )
-        )
-
+    @reflection.cache
+    def fetch_table_properties(self, connection, schema=None, **kw):
+        if schema is None:
+            schema = self._cached_default_schema(connection)
 
-        table_size_query = sql.text(
-            dedent(
-                """ 
-                select p.projection_schema, anchor_table_name, sum(used_bytes)
-                from projections p join storage_containers sc
-                on p.projection_name = sc.projection_name
-                and p.projection_schema = sc.schema_name
-                where lower(p.projection_schema)='%(schema)s'
-                group by 1,2;
-                """
-                % {"schema": schema.lower()}
+        properties = [
+            {
+                "create_time": str(row.create_time),
+                "table_name": row.table_name,
+                "table_size": f"{row.table_size} KB",
+            }
+            for row in connection.execute(
+                _TABLE_PROPERTIES_STMT, {"schema": schema.lower()}
             )
-        )
-
-        properties = []
-        for row in connection.execute(sct):
-            properties.append({"create_time": str(row[0]), "table_name": row[1]})
-        
-        # Dictionary to store table sizes
-        table_size_dict = {}
-
-        # Second loop to fetch table sizes
-        for table_size in connection.execute(table_size_query):
-            table_name, size = table_size[1], table_size[2]
-            TableSize = int(size / 1024)
-            if table_name not in table_size_dict:
-                table_size_dict[table_name] = str(TableSize) + " KB"
-            else:
-                table_size_dict[table_name] += str(TableSize) + " KB"
-
-
-        for a in properties:
-            if a["table_name"] in table_size_dict:
-                a["table_size"] = table_size_dict[a["table_name"]]
-            else:
-                a["table_size"] = "0 KB"
-                
-
+        ]
         return properties
 
+    @reflection.cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
-        if schema is not None:
-            schema = schema.lower()
-
-        properties = self.fetch_table_properties(connection, schema)
+        properties = self.fetch_table_properties(connection, schema, **kw)
+        table_name = table_name.lower()
         filtered_properties = [
             prop
             for prop in properties
-            if prop["table_name"].lower() == table_name.lower()
+            if prop["table_name"].lower() == table_name
         ]
         
         
@@ -701,150 +1234,110 @@ class VerticaDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_table_oid(self, connection, table_name, schema=None, **kw):
-        if schema is None:
-            schema = self._get_default_schema_name(connection)
-
-        get_oid_sql = sql.text(
-            dedent(
-                """
-            SELECT A.table_id
-            FROM
-                (SELECT table_id, table_name, table_schema FROM v_catalog.tables
-                    UNION
-                 SELECT table_id, table_name, table_schema FROM v_catalog.views) AS A
-            WHERE lower(A.table_name) = '%(table)s'
-            AND lower(A.table_schema) = '%(schema)s'
-        """
-                % {"schema": schema.lower(), "table": table_name.lower()}
-            )
-        )
+        if self._reflection_cache_enabled(kw):
+            if schema is None:
+                schema = self._cached_default_schema(connection)
+            # Every relation of the schema comes back with its oid, so
+            # resolve it from the cached listing instead of querying again.
+            table_name_l = table_name.lower()
+            for row in self._get_all_relation_info(connection, schema, **kw):
+                if row.table_name.lower() == table_name_l:
+                    return row.table_id
+            raise exc.NoSuchTableError(table_name)
 
-        c = connection.execute(get_oid_sql)
+        c = connection.execute(
+            _TABLE_OID_STMT,
+            {
+                "schema": schema.lower() if schema is not None else None,
+                "table": table_name.lower(),
+            },
+        )
         table_oid = c.scalar()
 
         if table_oid is None:
             raise exc.NoSuchTableError(table_name)
         return table_oid
 
+    @reflection.cache
     def get_projection_names(self, connection, schema=None, **kw):
         if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
+            schema_condition = "lower(projection_schema) = :schema"
         else:
-            schema_condition = "1"
+            schema_condition = "TRUE"
 
-        get_projection_sql = sql.text(
-            dedent(
-                """
+        get_projection_sql = _compiled(
+            """
             SELECT projection_name
             from v_catalog.projections
             WHERE %(schema_condition)s
             """
-                % {"schema_condition": schema_condition}
-            )
+            % {"schema_condition": schema_condition}
         )
+        if schema is not None:
+            get_projection_sql = get_projection_sql.bindparams(schema=schema.lower())
 
         c = connection.execute(get_projection_sql)
 
-        return [row[0] for row in c]
+        return c.scalars().all()
 
     @reflection.cache
-    def get_table_names(self, connection, schema=None, **kw):
+    @_global_schema_cache
+    def _get_all_relation_info(self, connection, schema=None, **kw):
         if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
+            schema_condition = "lower(table_schema) = :schema"
         else:
-            schema_condition = "1"
+            schema_condition = "TRUE"
 
-        get_tables_sql = sql.text(
-            dedent(
-                """
-            SELECT table_name
+        get_relations_sql = _compiled(
+            """
+            SELECT table_schema, table_name, table_id, 'table' AS relkind, is_temp_table
             FROM v_catalog.tables
             WHERE %(schema_condition)s
+            UNION ALL
+            SELECT table_schema, table_name, table_id, 'view' AS relkind, false AS is_temp_table
+            FROM v_catalog.views
+            WHERE %(schema_condition)s
             ORDER BY table_schema, table_name
         """
-                % {"schema_condition": schema_condition}
-            )
+            % {"schema_condition": schema_condition}
         )
+        if schema is not None:
+            get_relations_sql = get_relations_sql.bindparams(schema=schema.lower())
 
-        c = connection.execute(get_tables_sql)
-        return [row[0] for row in c]
+        return connection.execute(get_relations_sql).fetchall()
 
     @reflection.cache
-    def get_temp_table_names(self, connection, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        get_tables_sql = sql.text(
-            dedent(
-                """
-                SELECT table_name
-                FROM v_catalog.tables
-                WHERE %(schema_condition)s
-                AND IS_TEMP_TABLE
-                ORDER BY table_schema, table_name
-            """
-                % {"schema_condition": schema_condition}
-            )
-        )
-
-        c = connection.execute(get_tables_sql)
-        return [row[0] for row in c]
+    @_global_schema_cache
+    def _get_relation_kinds(self, connection, schema=None, **kw):
+        relations = self._get_all_relation_info(connection, schema, **kw)
+        return {row.table_name.lower(): row.relkind for row in relations}
 
     @reflection.cache
-    def get_view_names(self, connection, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
+    def get_table_names(self, connection, schema=None, **kw):
+        relations = self._get_all_relation_info(connection, schema, **kw)
+        return [row.table_name for row in relations if row.relkind == "table"]
 
-        get_views_sql = sql.text(
-            dedent(
-                """
-            SELECT table_name
-            FROM v_catalog.views
-            WHERE %(schema_condition)s
-            ORDER BY table_schema, table_name
-        """
-                % {"schema_condition": schema_condition}
-            )
-        )
+    @reflection.cache
+    def get_temp_table_names(self, connection, schema=None, **kw):
+        relations = self._get_all_relation_info(connection, schema, **kw)
+        return [
+            row.table_name
+            for row in relations
+            if row.relkind == "table" and row.is_temp_table
+        ]
 
-        c = connection.execute(get_views_sql)
-        return [row[0] for row in c]
+    @reflection.cache
+    def get_view_names(self, connection, schema=None, **kw):
+        relations = self._get_all_relation_info(connection, schema, **kw)
+        return [row.table_name for row in relations if row.relkind == "view"]
     
     @lru_cache(maxsize=None)
     def fetch_view_definitions(self, connection,schema):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-            
         definition = []
-            
-        view_def = sql.text(
-                dedent(
-                    """
-                    SELECT VIEW_DEFINITION , table_name
-                    FROM V_CATALOG.VIEWS
-                    WHERE table_schema='%(schema)s' 
-                    """
-                    % {"schema": schema.lower()}
-                )
-            )
-        
-        for data in connection.execute(view_def):
+
+        for data in connection.execute(
+            _VIEW_DEFINITIONS_STMT, {"schema": schema.lower()}
+        ):
             definition.append({
                 "view_def": data['VIEW_DEFINITION'],
                 "table_name": data['table_name']
@@ -854,17 +1347,10 @@ class VerticaDialect(default.DefaultDialect):
         
 
     def get_view_definition(self, connection, view_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-            
         view_def = self.fetch_view_definitions(connection,schema)
-        
+        view_name = view_name.lower()
         def_info = [
-            prop for prop in view_def if prop["table_name"].lower() == view_name.lower()
+            prop for prop in view_def if prop["table_name"].lower() == view_name
         ]
         
         if len(def_info) == 0:
@@ -880,28 +1366,50 @@ class VerticaDialect(default.DefaultDialect):
     def get_temp_view_names(self, connection, schema=None, **kw):
         return []
 
-    @lru_cache(maxsize=None)
-    def fetch_table_columns(self, connection, schema):
-        s = sql.text(
-            dedent(
-                """
-                SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
-                FROM v_catalog.columns
-                where lower(table_schema) = '%(schema)s'
-                UNION ALL
-                SELECT column_name, data_type, '' as column_default, true as is_nullable, lower(table_name) as table_name
-                FROM v_catalog.view_columns
-                where lower(table_schema) = '%(schema)s'
-                
-                
-            """
-                % {"schema": schema.lower()}
-            )
+    @reflection.cache
+    @_global_schema_cache
+    def _get_all_column_info(self, connection, schema=None, **kw):
+        if schema is None:
+            schema = self._cached_default_schema(connection)
+
+        columns = defaultdict(list)
+        self._collect_columns(
+            connection,
+            _SCHEMA_COLUMNS_STMT,
+            {"schema": schema.lower()},
+            schema,
+            columns,
         )
-        
-        
-        columns = []
-        for row in connection.execute(s):
+        return columns
+
+    @reflection.cache
+    @_global_schema_cache
+    def _get_table_columns(self, connection, schema=None, **kw):
+        return self._get_kind_columns(connection, _TABLE_COLUMNS_STMT, schema)
+
+    @reflection.cache
+    @_global_schema_cache
+    def _get_view_columns(self, connection, schema=None, **kw):
+        return self._get_kind_columns(connection, _VIEW_COLUMNS_STMT, schema)
+
+    @reflection.cache
+    @_global_schema_cache
+    def _get_projection_columns(self, connection, schema=None, **kw):
+        return self._get_kind_columns(connection, _PROJECTION_COLUMNS_STMT, schema)
+
+    def _get_kind_columns(self, connection, columns_sql, schema):
+        # Like _get_all_column_info, but reads a single catalog view.
+        if schema is None:
+            schema = self._cached_default_schema(connection)
+
+        columns = defaultdict(list)
+        self._collect_columns(
+            connection, columns_sql, {"schema": schema.lower()}, schema, columns
+        )
+        return columns
+
+    def _collect_columns(self, connection, columns_sql, params, schema, columns):
+        for row in connection.execute(columns_sql, params):
             name = row.column_name
             dtype = row.data_type.lower()
             default = row.column_default
@@ -910,31 +1418,70 @@ class VerticaDialect(default.DefaultDialect):
             column_info = self._get_column_info(
                 name, dtype, default, nullable, table_name, schema
             )
-            columns.append(column_info)
-        # print("projection_columns",columns)
+            columns[table_name].append(column_info)
+
+    def get_multi_columns(self, connection, schema=None, table_names=(), **kw):
+        """Return the columns of several tables or views in one query.
+
+        :param table_names: names of the tables or views to reflect.
+        return dictionary of lower-cased table name to list of columns
+        """
+        if schema is None:
+            schema = self._cached_default_schema(connection)
+
+        table_names = [table_name.lower() for table_name in table_names]
+        columns = {table_name: [] for table_name in table_names}
+        if not table_names:
+            return columns
+
+        self._collect_columns(
+            connection,
+            _MULTI_COLUMNS_STMT,
+            {"schema": schema.lower(), "table_names": table_names},
+            schema,
+            columns,
+        )
         return columns
-    
 
+    @reflection.cache
+    @_global_schema_cache
+    def _get_all_constraint_info(self, connection, schema=None, **kw):
+        if schema is not None:
+            schema = schema.lower()
 
-    # TODO this function doesnt seem to work even though the query is right
+        constraints = defaultdict(list)
+        for row in connection.execute(_SCHEMA_CONSTRAINTS_STMT, {"schema": schema}):
+            constraints[row.table_name].append(row)
+        return constraints
+
+    def _get_constraint_rows(self, connection, table_name, schema=None, **kw):
+        # Read the schema-wide listing only when it is kept for the next
+        # tables; otherwise ask for the constraints of this table alone.
+        if self._reflection_cache_enabled(kw):
+            constraints = self._get_all_constraint_info(connection, schema, **kw)
+            return constraints.get(table_name.lower(), [])
+
+        return connection.execute(
+            _TABLE_CONSTRAINTS_STMT,
+            {
+                "schema": schema.lower() if schema is not None else None,
+                "table": table_name.lower(),
+            },
+        ).fetchall()
 
     @reflection.cache
+    @_global_cache
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
-        if schema is None:
-            schema = self._get_default_schema_name(connection)
-
-        get_constraints_sql = sql.text(
-            dedent(
-                """
-                    SELECT constraint_name, column_name
-                    FROM v_catalog.constraint_columns
-                    WHERE table_name = '%(table)s' AND table_schema = '%(schema)s'
-                    """
-                % {"schema": schema.lower(), "table": table_name.lower()}
-            )
-        )
-        c = connection.execute(get_constraints_sql)
-        return [{"name": name, "column_names": cols} for name, cols in c.fetchall()]
+        # constraint_columns has one row per constrained column, and also
+        # lists the primary, foreign, not null and check constraints.
+        column_names = defaultdict(list)
+        for row in self._get_constraint_rows(connection, table_name, schema, **kw):
+            if row.constraint_type == "u":
+                column_names[row.constraint_name].append(row.column_name)
+        return [
+            {"name": name, "column_names": columns}
+            for name, columns in column_names.items()
+        ]
 
     @reflection.cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
@@ -942,27 +1489,13 @@ class VerticaDialect(default.DefaultDialect):
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
 
-        constraints_sql = sql.text(
-            dedent(
-                """
-            SELECT constraint_name, column_name
-            FROM v_catalog.constraint_columns
-            WHERE table_id = %(oid)s
-            AND constraint_type = 'c'
-        """
-                % {"oid": table_oid}
-            )
-        )
-
-        c = connection.execute(constraints_sql)
-
-        return [{"name": name, "sqltext": col} for name, col in c.fetchall()]
+        c = connection.execute(_CHECK_CONSTRAINTS_STMT, {"oid": table_oid})
+        return [{"name": name, "sqltext": col} for name, col in c]
 
     def normalize_name(self, name):
-        name = name and name.rstrip()
         if name is None:
             return None
-        return name.lower()
+        return _normalize_name(name)
 
     def denormalize_name(self, name):
         return name
@@ -972,10 +1505,26 @@ class VerticaDialect(default.DefaultDialect):
     # def get_pk_constraint(self, bind, table_name, schema=None, **kw):
     #     return {'constrained_columns': [], 'name': 'undefined'}
 
-    # TODO complete the foreign keys function
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        return []
+        foreign_keys = {}
+        for row in self._get_constraint_rows(connection, table_name, schema, **kw):
+            if row.constraint_type != "f":
+                continue
+            fkey = foreign_keys.setdefault(
+                row.constraint_name,
+                {
+                    "name": row.constraint_name,
+                    "constrained_columns": [],
+                    "referred_schema": row.reference_table_schema,
+                    "referred_table": row.reference_table_name,
+                    "referred_columns": [],
+                    "options": {},
+                },
+            )
+            fkey["constrained_columns"].append(row.column_name)
+            fkey["referred_columns"].append(row.reference_column_name)
+        return list(foreign_keys.values())
 
     # TODO complete the foreign keys function
     @reflection.cache
@@ -990,14 +1539,14 @@ class VerticaDialect(default.DefaultDialect):
     def _get_column_info(  # noqa: C901
         self, name, data_type, default, is_nullable, table_name, schema=None
     ):
-        attype: str = re.sub(r"\(.*\)", "", data_type)
+        attype: str = _RE_STRIP_PARENS.sub("", data_type)
 
-        charlen = re.search(r"\(([\d,]+)\)", data_type)
+        charlen = _RE_CHARLEN.search(data_type)
         if charlen:
             charlen = charlen.group(1)  # type: ignore
-        args = re.search(r"\((.*)\)", data_type)
+        args = _RE_ARGS.search(data_type)
         if args and args.group(1):
-            args = tuple(re.split(r"\s*,\s*", args.group(1)))  # type: ignore
+            args = tuple(_RE_SPLIT_COMMA.split(args.group(1)))  # type: ignore
         else:
             args = ()  # type: ignore
         kwargs: Dict[str, Any] = {}
@@ -1021,7 +1570,7 @@ class VerticaDialect(default.DefaultDialect):
         #     #     kwargs["precision"] = int(charlen)  # type: ignore
         #     args = ()  # type: ignore
         # elif attype.startswith("interval"):
-        #     field_match = re.match(r"interval (.+)", attype, re.I)
+        #     field_match = _RE_INTERVAL.match(attype)
         #     # if charlen:
         #     #     kwargs["precision"] = int(charlen)  # type: ignore
         #     if field_match:
@@ -1033,18 +1582,7 @@ class VerticaDialect(default.DefaultDialect):
         elif charlen:
             args = (int(charlen),)  # type: ignore
 
-        while True:
-            if attype.upper() in self.ischema_names:
-                coltype = self.ischema_names[attype.upper()]
-                break
-            else:
-                coltype = None
-                break
-
-        self.ischema_names["UUID"] = UUID
-        self.ischema_names["TIMESTAMP"] = TIMESTAMP_WITH_PRECISION
-        self.ischema_names["TIMESTAMPTZ"] = TIMESTAMP_WITH_TIMEZONE
-        self.ischema_names["TIMETZ"] = TIME_WITH_TIMEZONE
+        coltype = self.ischema_names.get(attype.upper())
 
         if coltype:
             coltype = coltype(*args, **kwargs)
@@ -1055,7 +1593,7 @@ class VerticaDialect(default.DefaultDialect):
         # adjust the default value
         autoincrement = False
         if default is not None:
-            match = re.search(r"""(nextval\(')([^']+)('.*$)""", default)
+            match = _RE_NEXTVAL.search(default)
             if match is not None:
                 if issubclass(coltype._type_affinity, sqltypes.Integer):
                     autoincrement = True
@@ -1086,598 +1624,201 @@ class VerticaDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_models_names(self, connection, schema=None, **kw):
-        get_models_sql = sql.text(
-            dedent(
-                """
-            SELECT model_name 
-            FROM models
-            WHERE lower(schema_name) =  '%(schema)s'
-            ORDER BY model_name
-        """
-                % {"schema": schema.lower()}
-            )
-        )
-
-        c = connection.execute(get_models_sql)
-
-        return [row[0] for row in c]
+        c = connection.execute(_MODEL_NAMES_STMT, {"schema": schema.lower()})
+        return c.scalars().all()
 
+    @reflection.cache
     def get_Oauth_names(self, connection, schema=None, **kw):
-        get_oauth_sql = sql.text(
-            dedent(
-                """
-            SELECT auth_name from v_catalog.client_auth
-            WHERE auth_method = 'OAUTH'
-        """
-                % {"schema": schema}
-            )
-        )
-        print("auth connection", schema.lower())
-        c = connection.execute(get_oauth_sql)
+        c = connection.execute(_OAUTH_NAMES_STMT)
+        return c.scalars().all()
 
-        return [row[0] for row in c]
+    @reflection.cache
+    @_global_cache
+    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
+        if not self._reflection_cache_enabled(kw):
+            return self.get_multi_pk_constraint(
+                connection, schema, [table_name]
+            )[table_name.lower()]
 
-    @lru_cache(maxsize=None)
-    def fetch_pk_constraint(self, connection, schema):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        spk = sql.text(
-            dedent(
-                """
-                SELECT column_name ,table_name
-                FROM v_catalog.primary_keys
-                WHERE lower(table_schema) = '%(schema)s'
-                
-            """
-                % {"schema": schema.lower()}
-            )
-        )
+        constraints = self._get_all_constraint_info(connection, schema, **kw)
+        return self._build_pk_constraint(constraints.get(table_name.lower(), []))
 
-        pk_columns = []
+    def get_multi_pk_constraint(self, connection, schema=None, table_names=(), **kw):
+        """Return the primary keys of several tables in one query.
 
-        for row in connection.execute(spk):
-            columns = row["column_name"]
-            table_name = row["table_name"].lower()
-            pk_columns.append(
-                {
-                    "constrained_columns": [columns],
-                    "name": [columns],
-                    "table_name": table_name,
-                }
-            )
-
-        return pk_columns
+        :param table_names: names of the tables to reflect.
+        return dictionary of lower-cased table name to primary key
+        """
+        if schema is None:
+            schema = self._cached_default_schema(connection)
 
-    def get_pk_constraint(self, connection, table_name, schema: None, **kw):
-        pk = self.fetch_pk_constraint(connection, schema)
+        table_names = [table_name.lower() for table_name in table_names]
+        constraints = {table_name: [] for table_name in table_names}
+        if table_names:
+            for row in connection.execute(
+                _MULTI_PK_STMT,
+                {"schema": schema.lower(), "table_names": table_names},
+            ):
+                constraints[row.table_name].append(row)
 
-        pk_columns = [
-            prop for prop in pk if prop["table_name"].lower() == table_name.lower()
-        ]
-        
-        if len(pk_columns) == 0:
-            return None
-        else:
-            return pk_columns[0]
-            
+        return {
+            table_name: self._build_pk_constraint(rows)
+            for table_name, rows in constraints.items()
+        }
 
+    def _build_pk_constraint(self, constraint_rows):
+        pk_rows = [row for row in constraint_rows if row.constraint_type == "p"]
+        return {
+            "constrained_columns": [row.column_name for row in pk_rows],
+            "name": pk_rows[0].constraint_name if pk_rows else None,
+        }
 
-    # @reflection.cache
     def _get_extra_tags(
-        self, connection, name, schema=None
+        self, connection, name, schema=None, **kw
     ) -> Optional[Dict[str, str]]:
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        owner_res = None
-        if name == "table":
-            table_owner_command = sql.text(
-                dedent(
-                    """
-                SELECT table_name, owner_name
-                FROM v_catalog.tables
-                WHERE %(schema_condition)s
-                """
-                    % {"schema_condition": schema_condition}
-                )
-            )
-
-            owner_res = connection.execute(table_owner_command)
-
-        elif name == "projection":
-            table_owner_command = sql.text(
-                dedent(
-                    """
-                SELECT projection_name as table_name, owner_name
-                FROM v_catalog.projections
-                WHERE lower(projection_schema) = '%(schema)s'
-                """
-                    % {"schema": schema.lower()}
-                )
-            )
-            owner_res = connection.execute(table_owner_command)
-
-        elif name == "view":
-            table_owner_command = sql.text(
-                dedent(
-                    """
-                SELECT table_name, owner_name
-                FROM v_catalog.views
-                WHERE %(schema_condition)s
-                """
-                    % {"schema_condition": schema_condition}
-                )
-            )
-            owner_res = connection.execute(table_owner_command)
-
-        final_tags = dict()
-        for each in owner_res:
-            final_tags[each["table_name"]] = each["owner_name"]
-        return final_tags
-
-    def _get_ros_count(self, connection, projection_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        src = sql.text(
-            dedent(
-                """
-                SELECT ros_count 
-                FROM v_monitor.projection_storage
-                WHERE lower(projection_name) = '%(table)s'
-
-            """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        for data in connection.execute(src):
-            ros_count = data["ros_count"]
-
-        return ros_count
-
-    def _get_segmented(self, connection, projection_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-        sig = sql.text(
-            dedent(
-                """
-                SELECT is_segmented 
-                FROM v_catalog.projections 
-                WHERE lower(projection_name) = '%(table)s'
-            """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        ssk = sql.text(
-            dedent(
-                """
-                SELECT  segment_expression 
-                FROM v_catalog.projections
-                WHERE lower(projection_name) = '%(table)s'
-            """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        is_segmented = ""
-        segmentation_key = ""
-        for data in connection.execute(sig):
-            is_segmented = str(data["is_segmented"])
-            if is_segmented:
-                for data in connection.execute(ssk):
-                    segmentation_key = str(data)
+        return self._get_all_extra_tags(connection, schema, **kw).get(name, {})
 
-        return is_segmented, segmentation_key
-
-    def _get_partitionkey(self, connection, projection_name, schema=None, **kw):
+    @reflection.cache
+    def _get_all_extra_tags(self, connection, schema=None, **kw):
+        """Return ``{kind: {name: owner}}`` for the tables, views and
+        projections of ``schema``, fetched in one round-trip."""
         if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
+            table_condition = "lower(table_schema) = :schema"
+            projection_condition = "lower(projection_schema) = :schema"
         else:
-            schema_condition = "1"
+            table_condition = projection_condition = "TRUE"
 
-        partition_key = ""
-        spk = sql.text(
-            dedent(
-                """
-                SELECT   partition_key
-                FROM v_monitor.partitions
-                WHERE lower(projection_name) = '%(table)s'
-                LIMIT 1
+        owner_sql = _compiled(
             """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        for data in connection.execute(spk):
-            partition_key = data["partition_key"]
-
-        return partition_key
-
-    def _get_projectiontype(self, connection, projection_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        projection_type = []
-        spt = sql.text(
-            dedent(
-                """
-                SELECT is_super_projection,is_key_constraint_projection,is_aggregate_projection,has_expressions
-                FROM v_catalog.projections
-                WHERE lower(projection_name) = '%(table)s'
-                AND %(schema_condition)s
-            """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        for data in connection.execute(spt):
-            lst = [
-                "is_super_projection",
-                "is_key_constraint_projection",
-                "is_aggregate_projection",
-                "has_expressions",
-            ]
-
-            i = 0
-            for d in range(len(data)):
-                if data[i]:
-                    projection_type.append(lst[i])
-                i += 1
-
-        return projection_type
-
-    def _get_numpartitions(self, connection, projection_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        partition_number = ""
-
-        snp = sql.text(
-            dedent(
-                """
-                SELECT Count(ros_id) as np
-                FROM v_monitor.partitions
-                WHERE lower(projection_name) = '%(table)s'
+            SELECT 'table' AS kind, table_name AS object_name, owner_name
+            FROM v_catalog.tables
+            WHERE %(table_condition)s
+            UNION ALL
+            SELECT 'view', table_name, owner_name
+            FROM v_catalog.views
+            WHERE %(table_condition)s
+            UNION ALL
+            SELECT 'projection', projection_name, owner_name
+            FROM v_catalog.projections
+            WHERE %(projection_condition)s
             """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        for data in connection.execute(snp):
-            partition_number = data.np
-
-        return partition_number
-
-    def _get_projectionsize(self, connection, projection_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
+            % {
+                "table_condition": table_condition,
+                "projection_condition": projection_condition,
             }
-        else:
-            schema_condition = "1"
-
-        sps = sql.text(
-            dedent(
-                """
-            SELECT ROUND(used_bytes // 1024)   AS used_bytes 
-            from v_monitor.projection_storage
-            WHERE lower(projection_name) = '%(table)s'
-        """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
         )
-
-        projection_size = ""
-
-        for data in connection.execute(sps):
-            projection_size = data["used_bytes"]
-
-        return projection_size
-
-    def _get_ifcachedproj(self, connection, projection_name, schema=None, **kw):
         if schema is not None:
-            schema_condition = "lower(projection_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-        depot_pin_policy = sql.text(
-            dedent(
-                """
-                SELECT COUNT(*)
-                FROM DEPOT_PIN_POLICIES
-                WHERE lower(object_name) = '%(table)s'
-            """
-                % {
-                    "table": projection_name.lower(),
-                    "schema_condition": schema_condition,
-                }
-            )
-        )
-
-        cached_projection = ""
+            owner_sql = owner_sql.bindparams(schema=schema.lower())
 
-        for data in connection.execute(depot_pin_policy):
-            if data[0] > 0:
-                cached_projection = True
-            else:
-                cached_projection = False
-        return cached_projection
-
-    @lru_cache(maxsize=None)
-    def fetch_projection_comments(self,connection,schema):
-        src = sql.text(
-            dedent(
-                """
-                SELECT ros_count , LOWER(projection_name)
-                FROM v_monitor.projection_storage
-                WHERE projection_schema = '%(schema)s'
-
-            """
-                % {"schema": schema}
-            )
-        )
-
-        projection_type = sql.text(
-            dedent(
-                """
-                SELECT DISTINCT is_super_projection,is_key_constraint_projection,is_aggregate_projection,has_expressions ,LOWER(projection_name)
-                FROM v_catalog.projections
-                WHERE projection_schema = '%(schema)s' 
-                """
-                % {"schema": schema}
-            )
-        )
+        tags = {"table": {}, "view": {}, "projection": {}}
+        for row in connection.execute(owner_sql):
+            tags[row.kind][row.object_name] = row.owner_name
+        return tags
 
-        is_segmented = sql.text(
-            dedent(
-                """
-                SELECT is_segmented , segment_expression , LOWER(projection_name)
-                FROM v_catalog.projections 
-                WHERE projection_schema = '%(schema)s'
-            """
-                % {"schema": schema}
-            )
-        )
+    @reflection.cache
+    def _get_projection_metadata(self, connection, projection_name, schema=None, **kw):
+        if schema is None:
+            schema = self._cached_default_schema(connection)
 
-        partition_key = sql.text(
-            dedent(
-                """
-                SELECT  DISTINCT LOWER(projection_name) ,  partition_key 
-                FROM v_monitor.partitions
-                WHERE table_schema = '%(schema)s'
-              
-            """
-                % {"schema": schema}
-            )
-        )
+        row = connection.execute(
+            _PROJECTION_METADATA_STMT,
+            {"projection": projection_name.lower(), "schema": schema.lower()},
+        ).first()
+        if row is None:
+            raise exc.NoSuchTableError(projection_name)
+        return self._build_projection_metadata(row)
 
-        # partition_num = sql.text(
-        #     dedent(
-        #         """
-        #         SELECT  COUNT(ros_id) as Partition_Size , LOWER(projection_name)
-        #         FROM v_monitor.partitions
-        #         WHERE table_schema = '%(schema)s'
-        #         GROUP BY projection_name
-        #     """
-        #         % {"schema": schema}
-        #     )
-        # )
-
-        num_of_partition = sql.text(
-            dedent(
-                """
-                    SELECT  LOWER(projection_name) ,  count(partition_key) as Partition_Size
-                    FROM v_monitor.partitions WHERE lower(table_schema) = '%(schema)s'  
-                    group by 1;
+    @reflection.cache
+    def _get_all_projection_metadata(self, connection, schema=None, **kw):
+        """Return ``{projection_name: ProjectionMetadata}`` for every
+        projection of ``schema``, fetched in one query."""
+        if schema is None:
+            schema = self._cached_default_schema(connection)
 
-                
-                """
-                % {"schema": schema}
+        return {
+            row.projection_name: self._build_projection_metadata(row)
+            for row in connection.execute(
+                _SCHEMA_PROJECTION_METADATA_STMT, {"schema": schema.lower()}
             )
-        )
+        }
 
-        projection_size = sql.text(
-            dedent(
-                """
-            SELECT used_bytes , LOWER(projection_name) 
-            from v_monitor.projection_storage
-            WHERE projection_schema = '%(schema)s'
-        """
-                % {"schema": schema}
+    def _build_projection_metadata(self, row):
+        projection_type = list(
+            compress(
+                _PROJECTION_TYPE_COLUMNS,
+                itemgetter(*_PROJECTION_TYPE_COLUMNS)(row._mapping),
             )
         )
 
-        projection_cache = sql.text(
-            dedent(
-                """
-            SELECT COUNT(*) , object_name
-            FROM DEPOT_PIN_POLICIES
-            WHERE schema_name = '%(schema)s'
-            GROUP BY object_name 
-            """
-                % {"schema": schema}
-            )
+        return ProjectionMetadata(
+            is_segmented=row.is_segmented,
+            segmentation_key=str(row.segment_expression),
+            projection_type=projection_type,
+            partition_key=row.partition_key,
+            num_partitions=row.num_partitions,
+            size=row.used_kb,
+            cached=row.pin_policies > 0,
+            ros_count=row.ros_count,
         )
 
-        projection_comment = []
-
-        ros_count = {}
-        for data in connection.execute(src):
-            # ros_count = data['ros_count']
-
-            ros_count = {"ROS_Count": data[0], "projection_name": data[1]}
-            projection_comment.append(ros_count)
-
-        lst = [
-            "is_super_projection",
-            "is_key_constraint_projection",
-            "is_aggregate_projection",
-            "has_expressions",
-        ]
-
-
-        for ptype in connection.execute(projection_type):
-            for i, value in enumerate(ptype):
-                if value is True:
-                    for a in projection_comment:
-                        if a["projection_name"] == ptype[4]:
-                            if "Projection_Type" in a:
-                                a["Projection_Type"] = (
-                                    a["Projection_Type"] + ", " + str(lst[i])
-                                )
-                            else:
-                                a["Projection_Type"] = str(lst[i])
-
-        for projection_segment in connection.execute(is_segmented):
-            for a in projection_comment:
-                if a["projection_name"] == projection_segment[2]:
-                    a["is_segmented"] = str(projection_segment[0])
-                    a["Segmentation_key"] = str(projection_segment[1])
-
-        for partion_keys in connection.execute(partition_key):
-            for a in projection_comment:
-                if a["projection_name"] == partion_keys[0]:
-                    a["Partition_Key"] = str(partion_keys[1])
-
-        projection_size_dict = {}
-        for projection_sizes in connection.execute(projection_size):
-            if projection_sizes[1] not in projection_size_dict:
-                projection_size_dict[projection_sizes[1]] = projection_sizes[0] / 1024
+    @reflection.cache
+    def _get_ros_count(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).ros_count
 
-            else:
-                projection_size_dict[projection_sizes[1]] += projection_sizes[0] / 1024
+    @reflection.cache
+    def _get_segmented(self, connection, projection_name, schema=None, **kw):
+        metadata = self._get_projection_metadata(connection, projection_name, schema, **kw)
+        return str(metadata.is_segmented), metadata.segmentation_key
 
-            for a in projection_comment:
-                if a["projection_name"] in projection_size_dict:
-                    a["projection_size"] = (
-                        str(int(projection_size_dict[a["projection_name"]])) + " KB"
-                    )
+    @reflection.cache
+    def _get_partitionkey(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).partition_key or ""
 
-                else:
-                    a["projection_size"] = "0 KB"
+    @reflection.cache
+    def _get_projectiontype(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).projection_type
 
-        for partition_number in connection.execute(num_of_partition):
-           
-            for a in projection_comment:
-                if a["projection_name"].lower() == partition_number[0].lower():
-                    a["Partition_Size"] = str(partition_number[1])
-                   
+    @reflection.cache
+    def _get_numpartitions(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).num_partitions
 
+    @reflection.cache
+    def _get_projectionsize(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).size
 
-        for projection_cached in connection.execute(projection_cache):
-            for a in projection_comment:
-                if projection_cached[0] > 0:
-                    a["Projection_Cached"] = True
-                else:
-                    a["Projection_Cached"] = False
+    @reflection.cache
+    def _get_ifcachedproj(self, connection, projection_name, schema=None, **kw):
+        return self._get_projection_metadata(connection, projection_name, schema, **kw).cached
 
-        return projection_comment
-        
-    
+    @reflection.cache
     def get_projection_comment(self, connection, projection, schema=None, **kw):
-        try:
-
-            comments = self.fetch_projection_comments(connection,schema)
-            projection_comments  = [prop for prop in comments if prop["projection_name"].lower() == projection.lower()]
-           
-            projection_properties={}
-            
-            if 'ROS_Count' in projection_comments[0]:
-                projection_properties["ROS_Count"] = str(projection_comments[0]['ROS_Count'])
-            else:
-                projection_properties["ROS_Count"] = "Not Available"
-                
-            if 'Projection_Type' in projection_comments[0]:
-                projection_properties['Projection_Type']=  str(projection_comments[0]['Projection_Type'])
-            else :
-                projection_properties['Projection_Type']= "Not Available"
-                
-            if 'is_segmented' in projection_comments[0]:
-                projection_properties['Is_Segmented'] = str(projection_comments[0]['is_segmented'])
-            else:
-                projection_properties['Is_Segmented'] = "Not Available"
-                
-            if 'Segmentation_key' in projection_comments[0]:
-                projection_properties['Segmentation_key'] = str(projection_comments[0]['Segmentation_key'])
-            else:
-                projection_properties['Segmentation_key'] = "Not Available"
-                
-            if 'projection_size' in projection_comments[0]:
-                projection_properties['Projection_size'] = str(projection_comments[0]['projection_size'])
-            else:
-                projection_properties['Projection_size'] = "0 KB"
-                
-            if 'Partition_Key' in projection_comments[0]:
-                projection_properties['Partition_Key'] = str(projection_comments[0]['Partition_Key'])
-            else:
-                projection_properties['Partition_Key'] = "Not Available"
-                
-            if 'Partition_Size' in projection_comments[0]:
-                projection_properties['Number_Of_Partitions'] = str(projection_comments[0]['Partition_Size'])
-            else:
-                projection_properties['Number_Of_Partitions'] =  "0" 
-            
-            if 'Projection_Cached' in projection_comments[0]:
-                projection_properties['Projection_Cached'] = str(projection_comments[0]['Projection_Cached'])
-            else:
-                projection_properties['Projection_Cached'] = "False"
-            
+        if kw.get("info_cache") is not None:
+            # Projections are usually described one after another, so
+            # fetch the whole schema once and keep it in the info_cache.
+            metadata = self._get_all_projection_metadata(
+                connection, schema, **kw
+            ).get(projection.lower())
+            if metadata is None:
+                raise exc.NoSuchTableError(projection)
+        else:
+            metadata = self._get_projection_metadata(
+                connection, projection, schema, **kw
+            )
+
+        projection_properties = {
+            "ROS_Count": str(metadata.ros_count)
+            if metadata.ros_count is not None
+            else "Not Available",
+            "Projection_Type": ", ".join(metadata.projection_type)
+            or "Not Available",
+            "Is_Segmented": str(metadata.is_segmented),
+            "Segmentation_key": metadata.segmentation_key,
+            "Projection_size": "%s KB" % (metadata.size or 0),
+            "Partition_Key": metadata.partition_key or "Not Available",
+            "Number_Of_Partitions": str(metadata.num_partitions),
+            "Projection_Cached": str(metadata.cached),
+        }
 
-        except Exception as e:
-            print(e)
-      
-        
         return {
             "text": "Vertica physically stores table data in projections, \
             which are collections of table columns. Projections store data in a format that optimizes query execution \
@@ -1685,90 +1826,84 @@ class VerticaDialect(default.DefaultDialect):
             "properties": projection_properties,
         }
 
+    def _execute_batch(self, connection, statements):
+        """Run ``statements`` in a single round-trip where the driver allows
+        it, and return the rows of each, in order."""
+        if not statements:
+            return []
+        if not self.supports_multi_statement_results:
+            return [connection.exec_driver_sql(stmt).fetchall() for stmt in statements]
+
+        # exec_driver_sql fires the cursor events, echoes the batch and wraps
+        # errors of the first statement; the later result sets are read
+        # straight off the DBAPI cursor.
+        batch = ";\n".join(statements)
+        result = connection.exec_driver_sql(batch)
+        cursor = result.cursor
+        try:
+            results = [cursor.fetchall()]
+            while cursor.nextset():
+                results.append(cursor.fetchall())
+        except self.dbapi.Error as err:
+            util.raise_(
+                exc.DBAPIError.instance(batch, None, err, self.dbapi.Error),
+                from_=err,
+            )
+        finally:
+            result.close()
+        return results
+
     @reflection.cache
     def get_model_comment(self, connection, model_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(schema_name) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        model_used_by = sql.text(
-            dedent(
-                """
-                select owner_name from models
-                where model_name = '%(model)s'
-                
-            """
-                % {"model": model_name}
-            )
-        )
-
-        model_attr_name = sql.text(
-            dedent(
-                """
-                SELECT 
-                    GET_MODEL_ATTRIBUTE 
-                        ( USING PARAMETERS model_name='%(schema)s.%(model)s');
-                
-            """
-                % {"model": model_name, "schema": schema.lower()}
-            )
+        if schema is None:
+            schema = self._cached_default_schema(connection)
+        # USING PARAMETERS only takes literals, so these cannot be binds.
+        qualified_model = _quote_literal("%s.%s" % (schema.lower(), model_name))
+
+        # The owner and the attribute list share one round-trip, then the
+        # details of every attribute come back together in a second one.
+        owner_rows, attr_rows = self._execute_batch(
+            connection,
+            [
+                "SELECT owner_name FROM v_catalog.models"
+                " WHERE model_name = %s AND lower(schema_name) = %s LIMIT 1"
+                % (_quote_literal(model_name), _quote_literal(schema.lower())),
+                "SELECT GET_MODEL_ATTRIBUTE(USING PARAMETERS model_name=%s)"
+                % qualified_model,
+            ],
         )
 
-        used_by = ""
-        attr_name = []
-        attr_details = []
-        for data in connection.execute(model_used_by):
-            used_by = data["owner_name"]
-
-        for data in connection.execute(model_attr_name):
-            attributes = {
+        used_by = owner_rows[0][0] if owner_rows else ""
+        attr_name = [
+            {
                 "attr_name": data[0],
                 "attr_fields": data[1],
                 "#_of_rows": data[2],
             }
+            for data in attr_rows
+        ]
 
-            attr_name.append(attributes)
+        attr_detail_rows = self._execute_batch(
+            connection,
+            [
+                "SELECT GET_MODEL_ATTRIBUTE(USING PARAMETERS model_name=%s,"
+                " attr_name=%s)" % (qualified_model, _quote_literal(data["attr_name"]))
+                for data in attr_name
+            ],
+        )
 
         attributes_details = []
-        for data in attr_name:
-            attr_details_dict = dict()
+        for data, detail_rows in zip(attr_name, attr_detail_rows):
             attr_names = data["attr_name"]
             attr_fields = str(data["attr_fields"]).split(",")
 
-            get_attr_details = sql.text(
-                dedent(
-                    """
-                    SELECT 
-                        GET_MODEL_ATTRIBUTE 
-                            ( USING PARAMETERS model_name='%(schema)s.%(model)s', attr_name='%(attr_name)s');
-                    
-                """
-                    % {
-                        "model": model_name,
-                        "schema": schema.lower(),
-                        "attr_name": attr_names,
-                    }
-                )
-            )
-
-            value_final = dict()
+            # Pivot the detail rows into one list of values per field.
             attr_details_dict = {"attr_name": attr_names}
-            for data in connection.execute(get_attr_details):
-                if len(attr_fields) > 1:
-                    for index, each in enumerate(attr_fields):
-                        if each not in value_final:
-                            value_final[each] = list()
-                        value_final[each].append(data[index])
-
-                else:
-                    if attr_fields[0] not in value_final:
-                        value_final[attr_fields[0]] = list()
-                    value_final[attr_fields[0]].append(data[0])
-
-            attr_details_dict.update(value_final)
+            if detail_rows:
+                attr_details_dict.update(
+                    (field, [row[index] for row in detail_rows])
+                    for index, field in enumerate(attr_fields)
+                )
             attributes_details.append(attr_details_dict)
 
         return {
@@ -1784,114 +1919,65 @@ class VerticaDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_oauth_comment(self, connection, oauth, schema=None, **kw):
-        get_oauth_comments = sql.text(
-            dedent(
-                """
-            SELECT auth_oid ,
-            is_auth_enabled, 
-            is_fallthrough_enabled,
-            auth_parameters ,
-            auth_priority ,
-            address_priority 
-            from v_catalog.client_auth
-            WHERE auth_method = 'OAUTH'
-
-            """
-            )
-        )
-        client_id = ""
-        client_secret = ""
-        for data in connection.execute(get_oauth_comments):
-            whole_data = str(data["auth_parameters"]).split(", ")
-            client_id_data = whole_data[0].split("=")
-            if client_id_data:
-                # client_data.update({client_id_data[0] : client_id_data[1]})
-                client_id = client_id_data[1]
-
-            client_secret_data = whole_data[1].split("=")
-            if client_secret_data:
-                # client_data.update({client_secret_data[0] : client_secret_data[1]})
-                client_secret = client_secret_data[1]
-
-            client_discorvery_url = whole_data[2].split("=")
-            if client_discorvery_url:
-                # client_data.update({client_secret_data[0] : client_secret_data[1]})
-                discovery_url = client_discorvery_url[1]
-
-            client_introspect_url = whole_data[3].split("=")
-            if client_introspect_url:
-                # client_data.update({client_secret_data[0] : client_secret_data[1]})
-                introspect_url = client_introspect_url[1]
-
-            auth_oid = data["auth_oid"]
-            is_auth_enabled = data["is_auth_enabled"]
-            auth_priority = data["auth_priority"]
-            address_priority = data["address_priority"]
-            is_fallthrough_enabled = data["is_fallthrough_enabled"]
+        # The parameters are parsed by name in SQL, so their order inside
+        # auth_parameters no longer matters.
+        data = connection.execute(_OAUTH_COMMENT_STMT).mappings().first() or {}
 
         return {
             "text": "Vertica supports OAUTH based authentication. \
             These properties are only visible in Datahub if you have access to the authorization table in Vertica. \
             All the properties shown here are what Vertica uses for a client connecting via OAUTH.",
             "properties": {
-                "discovery_url": str(discovery_url),
-                "client_id": str(client_id),
-                "introspect_url": str(introspect_url),
-                "auth_oid ": str(auth_oid),
-                "client_secret": str(client_secret),
-                "is_auth_enabled": str(is_auth_enabled),
-                "auth_priority": str(auth_priority),
-                "address_priority": str(address_priority),
-                "is_fallthrough_enabled": str(is_fallthrough_enabled),
+                "discovery_url": str(data.get("discovery_url")),
+                "client_id": str(data.get("client_id")),
+                "introspect_url": str(data.get("introspect_url")),
+                "auth_oid ": str(data.get("auth_oid")),
+                "client_secret": str(data.get("client_secret")),
+                "is_auth_enabled": str(data.get("is_auth_enabled")),
+                "auth_priority": str(data.get("auth_priority")),
+                "address_priority": str(data.get("address_priority")),
+                "is_fallthrough_enabled": str(data.get("is_fallthrough_enabled")),
             },
         }
-        
+
     def get_all_columns(self, connection, table, schema=None, **kw):
-        columns = self.fetch_table_columns(connection, schema)
-        table_columns = [
-            prop for prop in columns if prop["table_name"].lower() == table.lower()
-        ]
-        return table_columns
+        columns = self._get_all_column_info(connection, schema, **kw)
+        return columns.get(table.lower(), [])
     
     @reflection.cache
+    @_global_cache
     def get_columns(self, connection, table_name, schema=None, **kw):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                'schema': schema.lower()}
+        table_name = table_name.lower()
+        if not self._reflection_cache_enabled(kw):
+            return self.get_multi_columns(connection, schema, [table_name])[
+                table_name
+            ]
+
+        if schema is None:
+            schema = self._cached_default_schema(connection)
+
+        # The relation kinds and column listings are memoized from here on
+        # (info_cache or caching_schema()), so looking the kind up costs one
+        # scan per schema, not per call. Scan only the catalog matching the
+        # kind; projections and unknown names fall back to the union over
+        # tables and views.
+        kind = self._get_relation_kinds(connection, schema, **kw).get(table_name)
+        if kind == "table":
+            columns = self._get_table_columns(connection, schema, **kw)
+        elif kind == "view":
+            columns = self._get_view_columns(connection, schema, **kw)
         else:
-            schema_condition = "1"
-            
-        columns = self.fetch_table_columns(connection, schema)
-        
-        table_columns = [
-            prop for prop in columns if prop["table_name"].lower() == table_name.lower()
-        ]
-        return table_columns
+            columns = self._get_all_column_info(connection, schema, **kw)
+        return columns.get(table_name, [])
 
     ########################################################## new code ############################################################
 
     @lru_cache(maxsize=None)
     def fetch_table_owner(self, connection, schema):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        sct = sql.text(
-            dedent(
-                """
-                SELECT table_name ,owner_name 
-                FROM v_catalog.tables
-                where lower(table_schema) = '%(schema)s'
-            """
-                % {"schema": schema.lower()}
-            )
-        )
-
         owner_info = []
-        for row in connection.execute(sct):
+        for row in connection.execute(
+            _TABLE_OWNERS_STMT, {"schema": schema.lower()}
+        ):
             owner_info.append(
                 {"table_name": row.table_name, "owner_name": row.owner_name}
             )
@@ -1902,82 +1988,25 @@ class VerticaDialect(default.DefaultDialect):
 
     def get_table_owner(self, connection, table, schema=None, **kw):
         owner = self.fetch_table_owner(connection, schema)
-        
-        
+        table = table.lower()
         owner_info = [
-            prop for prop in owner if prop["table_name"].lower() == table.lower()
+            prop for prop in owner if prop["table_name"].lower() == table
         ]
         table_owner = owner_info[0]['owner_name']
       
         return table_owner
 
 
-    @lru_cache(maxsize=None)
-    def fetch_view_columns(self, connection, schema):
-        s = sql.text(
-            dedent(
-                """
-            SELECT column_name, data_type, '' as column_default, true as is_nullable,lower(table_name) as table_name
-            FROM v_catalog.view_columns
-            where lower(table_schema) = '%(schema)s'
-        """
-                % {"schema": schema.lower()}
-            )
-        )
-
-        columns = []
-
-        for row in connection.execute(s):
-            name = row.column_name
-            dtype = row.data_type.lower()
-            default = row.column_default
-            nullable = row.is_nullable
-            table_name = row.table_name.lower()
-
-            column_info = self._get_column_info(
-                name, dtype, default, nullable,table_name, schema
-            )
-            # print(column_info)
-            # column_info.update({'primary_key': primary_key})
-            columns.append(column_info)
-
-        return columns
-    
-   
- 
     def get_view_columns(self, connection, view, schema=None, **kw):
-        
-        columns = self.fetch_view_columns(connection, schema)
-        table_columns = [
-            prop for prop in columns if prop["table_name"].lower() == view.lower()
-        ]
-        
-        return table_columns
-    
+        columns = self._get_view_columns(connection, schema, **kw)
+        return columns.get(view.lower(), [])
+
     @lru_cache(maxsize=None)
     def fetch_view_comment(self, connection, schema):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        sct = sql.text(
-            dedent(
-                """
-                SELECT create_time , table_name
-                FROM v_catalog.views
-                where lower(table_schema) = '%(schema)s'
-               
-                
-            """
-                % {"schema": schema.lower()}
-            )
-        )
-
         comments = []
-        for row in connection.execute(sct):
+        for row in connection.execute(
+            _VIEW_COMMENTS_STMT, {"schema": schema.lower()}
+        ):
             comments.append({"create_time": str(row[0]), "table_name": row[1]})
             
         return comments
@@ -1986,8 +2015,8 @@ class VerticaDialect(default.DefaultDialect):
     def get_view_comment(self, connection, view, schema=None, **kw):
         
         comments = self.fetch_view_comment(connection, schema )
-        
-        view_comments  = [prop for prop in comments if prop["table_name"].lower() == view.lower()]
+        view = view.lower()
+        view_comments  = [prop for prop in comments if prop["table_name"].lower() == view]
         
         view_properties = {
                 "create_time": view_comments[0]['create_time'],
@@ -2004,26 +2033,10 @@ class VerticaDialect(default.DefaultDialect):
 
     @lru_cache(maxsize=None)
     def fetch_view_owner(self, connection, schema):
-        if schema is not None:
-            schema_condition = "lower(table_schema) = '%(schema)s'" % {
-                "schema": schema.lower()
-            }
-        else:
-            schema_condition = "1"
-
-        sct = sql.text(
-            dedent(
-                """
-                SELECT table_name ,owner_name 
-                FROM v_catalog.views
-                where lower(table_schema) = '%(schema)s'
-            """
-                % {"schema": schema.lower()}
-            )
-        )
-
         owner_info = []
-        for row in connection.execute(sct):
+        for row in connection.execute(
+            _VIEW_OWNERS_STMT, {"schema": schema.lower()}
+        ):
             owner_info.append(
                 {"table_name": row.table_name, "owner_name": row.owner_name}
             )
@@ -2035,10 +2048,9 @@ class VerticaDialect(default.DefaultDialect):
     def get_view_owner(self, connection, view, schema=None, **kw):
         
         owner = self.fetch_view_owner(connection, schema)
-        
-        
+        view = view.lower()
         owner_info = [
-            prop for prop in owner if prop["table_name"].lower() == view.lower()
+            prop for prop in owner if prop["table_name"].lower() == view
         ]
         view_owner = owner_info[0]['owner_name']
         
@@ -2047,18 +2059,8 @@ class VerticaDialect(default.DefaultDialect):
     
     @lru_cache(maxsize=None)
     def fetch_view_lineage(self, connection,schema) -> None:
-        
-
-        view_upstream_lineage_query = sql.text(
-            dedent(
-                """
-            select table_name ,table_schema, reference_table_name ,reference_table_schema  from v_catalog.view_tables where table_schema = '%(schema)s' """
-                % {"schema": schema}
-            )
-        )
-
         refrence_table = []
-        for data in connection.execute(view_upstream_lineage_query):
+        for data in connection.execute(_VIEW_LINEAGE_STMT, {"schema": schema}).mappings():
             # refrence_table.append(data)
             refrence_table.append(
                 {
@@ -2109,9 +2111,10 @@ class VerticaDialect(default.DefaultDialect):
                 
             return view_lineage_map
 
-        except Exception as e:
-            import traceback
-            print(traceback.format_exc())
+        except Exception:
+            logger.debug(
+                "Extracting the view lineage of %s failed", schema, exc_info=True
+            )
             
                 # logger.info(
                 #     "view_upstream_lineage",
@@ -2122,62 +2125,16 @@ class VerticaDialect(default.DefaultDialect):
 
         
 
-    @lru_cache(maxsize = None)
-    def fetch_projection_columns(self,connection, schema):
-        s = sql.text(
-            dedent(
-                """
-            SELECT projection_column_name, data_type, '' as column_default, true as is_nullable,lower(projection_name) as projection_name
-            FROM PROJECTION_COLUMNS
-            where lower(table_schema) = '%(schema)s'
-        """
-                % {"schema": schema.lower()}
-            )
-        )
-
-        columns = []
-
-        for row in connection.execute(s):
-            name = row.projection_column_name
-            dtype = row.data_type.lower()
-            default = row.column_default
-            nullable = row.is_nullable
-            tablename = row.projection_name.lower()
-
-            column_info = self._get_column_info(
-                name, dtype, default, nullable,  tablename, schema,
-            )
-            # print(column_info)
-            # column_info.update({'primary_key': primary_key})
-            columns.append(column_info)
-
-        return columns
-    
     def get_projection_columns(self, connection,projection, schema=None, **kw):
-        
-        columns = self.fetch_projection_columns(connection,schema)
-       
-        projection_columns = [
-            prop for prop in columns if prop["table_name"].lower() == projection.lower()
-        ]
-       
-        return projection_columns
-        
+        columns = self._get_projection_columns(connection, schema, **kw)
+        return columns.get(projection.lower(), [])
+
     @lru_cache(maxsize=None)
     def fetch_projection_owner(self,connection,schema):
-        projection_owner_command = sql.text(
-            dedent(
-                """
-                SELECT projection_name as table_name, owner_name
-                FROM v_catalog.projections
-                WHERE lower(projection_schema) = '%(schema)s'
-                """
-                % {"schema": schema.lower()}
-            )
-        )
-
         owner_info = []
-        for row in connection.execute(projection_owner_command):
+        for row in connection.execute(
+            _PROJECTION_OWNERS_STMT, {"schema": schema.lower()}
+        ):
             owner_info.append(row)
             # print(row)
 
@@ -2186,8 +2143,9 @@ class VerticaDialect(default.DefaultDialect):
 
     def get_projection_owner(self, connection, projection,schema=None, **kw):
         owner = self.fetch_projection_owner(connection,schema)
+        projection = projection.lower()
         projections_owner = [
-            prop for prop in owner if prop[0].lower() == projection.lower()
+            prop for prop in owner if prop[0].lower() == projection
         ]
         projection_owner = projections_owner[0][1]
         return projection_owner
@@ -2197,14 +2155,7 @@ class VerticaDialect(default.DefaultDialect):
         
         refrence_table = []
         
-        projection_upstream_lineage_query = sql.text(
-            dedent(
-                """
-            select basename , schemaname , name from vs_projections where schemaname = '%(schema)s' """
-                % {"schema": schema}
-            )
-        )
-        for data in connection.execute(projection_upstream_lineage_query):
+        for data in connection.execute(_PROJECTION_LINEAGE_STMT, {"schema": schema}).mappings():
             # refrence_table.append(data)
             refrence_table.append(
                 {
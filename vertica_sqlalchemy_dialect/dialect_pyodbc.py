@@ -26,8 +26,9 @@ from .base import VerticaDialect as BaseVerticaDialect
 # noinspection PyAbstractClass, PyClassHasNoInit
 class VerticaDialect(PyODBCConnector, BaseVerticaDialect):
     driver = 'pyodbc'
-    # TODO: support SQL caching, for more info see: https://docs.sqlalchemy.org/en/14/core/connections.html#caching-for-third-party-dialects
-    supports_statement_cache = False
+    # SQLAlchemy checks this flag on each dialect class individually, see:
+    # https://docs.sqlalchemy.org/en/14/core/connections.html#caching-for-third-party-dialects
+    supports_statement_cache = True
 
     @classmethod
     def dbapi(cls):
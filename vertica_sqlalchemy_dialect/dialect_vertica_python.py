@@ -24,10 +24,12 @@ from .base import VerticaDialect as BaseVerticaDialect
 # noinspection PyAbstractClass, PyClassHasNoInit
 class VerticaDialect(BaseVerticaDialect):
     driver = 'vertica_python'
-    # TODO: support SQL caching, for more info see: https://docs.sqlalchemy.org/en/14/core/connections.html#caching-for-third-party-dialects
-    supports_statement_cache = False
+    # SQLAlchemy checks this flag on each dialect class individually, see:
+    # https://docs.sqlalchemy.org/en/14/core/connections.html#caching-for-third-party-dialects
+    supports_statement_cache = True
     # No lastrowid support. TODO support SELECT LAST_INSERT_ID();
     postfetch_lastrowid = False
+    supports_multi_statement_results = True
 
     @classmethod
     def dbapi(cls):